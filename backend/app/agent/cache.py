@@ -0,0 +1,84 @@
+"""In-process result cache for whole analysis runs."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+from app.config import settings
+
+
+def analysis_cache_key(
+    ticket_ids: Optional[List[int]],
+    ticket_versions: Iterable[Tuple[int, Any]]
+) -> str:
+    """Fingerprint an analysis request by requested IDs and ticket last-modified times.
+
+    Args:
+        ticket_ids: Requested ticket IDs (None/empty means all tickets)
+        ticket_versions: (ticket_id, updated_at) pairs for the tickets being analyzed
+
+    Returns:
+        SHA-256 hex digest; changes whenever a ticket is added, removed or edited
+    """
+    content: List[Tuple[int, Optional[str]]] = sorted(
+        (ticket_id, updated_at.isoformat() if updated_at else None)
+        for ticket_id, updated_at in ticket_versions
+    )
+    payload = json.dumps({"ids": sorted(ticket_ids or []), "content": content})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AnalysisResultCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss counters."""
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss, expiry or when caching is disabled."""
+        if settings.cache_disabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if settings.cache_disabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# Shared cache of AnalyzeResponse objects, keyed by analysis_cache_key
+analysis_cache = AnalysisResultCache(
+    max_size=settings.analysis_cache_size,
+    ttl_seconds=settings.analysis_cache_ttl
+)
@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, insert, ScalarResult
 
 from app.models import Ticket, AnalysisRun, TicketAnalysis
 from app.schemas import TicketAnalysisOutput
@@ -12,14 +12,20 @@ def get_tickets_by_ids(db: Session, ticket_ids: List[int]) -> List[Ticket]:
     """Fetch tickets by their IDs."""
     stmt = select(Ticket).where(Ticket.id.in_(ticket_ids))
     result = db.execute(stmt)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
-def get_all_tickets(db: Session) -> List[Ticket]:
-    """Fetch all tickets."""
-    stmt = select(Ticket)
-    result = db.execute(stmt)
-    return list(result.scalars().all())
+# Rows fetched per server-side cursor round trip when streaming all tickets
+TICKET_STREAM_BATCH_SIZE = 500
+
+
+def get_all_tickets(db: Session) -> ScalarResult[Ticket]:
+    """Stream all tickets in chunks of TICKET_STREAM_BATCH_SIZE rows.
+    
+    Returns a lazy result; callers iterate it and close it when done.
+    """
+    stmt = select(Ticket).execution_options(yield_per=TICKET_STREAM_BATCH_SIZE)
+    return db.execute(stmt).scalars()
 
 
 def create_analysis_run(db: Session, summary: str = "") -> AnalysisRun:
@@ -38,9 +44,14 @@ def update_analysis_run(
     db: Session,
     run_id: int,
     summary: str,
-    status: str = "completed"
+    status: str = "completed",
+    commit: bool = True
 ) -> AnalysisRun:
-    """Update an analysis run with results."""
+    """Update an analysis run with results.
+    
+    With commit=False the change is only flushed, so the caller can commit it
+    together with other writes in one transaction.
+    """
     stmt = select(AnalysisRun).where(AnalysisRun.id == run_id)
     result = db.execute(stmt)
     analysis_run = result.scalar_one_or_none()
@@ -51,43 +62,47 @@ def update_analysis_run(
     analysis_run.summary = summary
     analysis_run.status = status
     
-    db.commit()
-    db.refresh(analysis_run)
+    if commit:
+        db.commit()
+        db.refresh(analysis_run)
+    else:
+        db.flush()
     return analysis_run
 
 
 def save_ticket_analyses(
     db: Session,
     run_id: int,
-    analyses: List[dict]
-) -> List[TicketAnalysis]:
-    """Save ticket analysis results to database."""
-    import json
-    ticket_analyses = []
+    analyses: List[dict],
+    commit: bool = True
+) -> List[int]:
+    """Save ticket analysis results to database in a single bulk INSERT.
     
-    for analysis in analyses:
-        # Convert lists to JSON strings for storage
-        potential_causes_json = json.dumps(analysis.get("potential_causes", []))
-        suggested_solutions_json = json.dumps(analysis.get("suggested_solutions", []))
-        
-        ticket_analysis = TicketAnalysis(
-            analysis_run_id=run_id,
-            ticket_id=analysis["ticket_id"],
-            category=analysis["category"],
-            priority=analysis["priority"],
-            notes=analysis.get("notes"),
-            analysis=analysis.get("analysis"),
-            potential_causes=potential_causes_json,
-            suggested_solutions=suggested_solutions_json
-        )
-        db.add(ticket_analysis)
-        ticket_analyses.append(ticket_analysis)
+    With commit=False the caller is responsible for committing the transaction.
+    """
+    if not analyses:
+        return []
     
-    db.commit()
+    rows = [
+        {
+            "analysis_run_id": run_id,
+            "ticket_id": analysis["ticket_id"],
+            "category": analysis["category"],
+            "priority": analysis["priority"],
+            "notes": analysis.get("notes"),
+            "analysis": analysis.get("analysis"),
+            # Native JSON columns - the driver serializes the lists
+            "potential_causes": analysis.get("potential_causes", []),
+            "suggested_solutions": analysis.get("suggested_solutions", [])
+        }
+        for analysis in analyses
+    ]
     
-    # Refresh all objects
-    for ta in ticket_analyses:
-        db.refresh(ta)
+    # insertmanyvalues batches all rows (and their RETURNING ids) into one round-trip
+    stmt = insert(TicketAnalysis).returning(TicketAnalysis.id)
+    result = db.execute(stmt, rows)
+    ticket_analysis_ids = result.scalars().all()
     
-    return ticket_analyses
-
+    if commit:
+        db.commit()
+    return ticket_analysis_ids
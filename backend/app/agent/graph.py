@@ -1,10 +1,16 @@
 """LangGraph agent graph definition."""
 
+import hashlib
+import json
+from functools import partial
 from typing import List, Optional, Any
+from langgraph.cache.memory import InMemoryCache
 from langgraph.graph import StateGraph, END
+from langgraph.types import CachePolicy
 from sqlalchemy.orm import Session
 
 from app.agent.state import AnalysisState
+from app.config import settings
 from app.agent.nodes import (
     validate_input,
     initialize_run,
@@ -15,6 +21,18 @@ from app.agent.nodes import (
 )
 
 
+# Node-level cache shared by every compiled graph, so re-summarizing identical results
+# is skipped. analyze_tickets is not node-cached: its per-ticket cache already skips
+# the LLM for unchanged tickets and reports no tokens/cost for them
+_node_cache = InMemoryCache()
+NODE_CACHE_TTL = 3600  # seconds
+
+
+def _generate_summary_cache_key(state: AnalysisState) -> str:
+    """Key generate_summary on a hash of the analysis results."""
+    return hashlib.sha256(json.dumps(state.results, sort_keys=True).encode()).hexdigest()
+
+
 def create_analysis_graph(db: Session, langfuse_handler: Optional[Any] = None) -> StateGraph:
     """Create the LangGraph analysis graph."""
     
@@ -22,12 +40,23 @@ def create_analysis_graph(db: Session, langfuse_handler: Optional[Any] = None) -
     graph = StateGraph(AnalysisState)
     
     # Add nodes
-    graph.add_node("validate_input", lambda state: validate_input(state, db))
-    graph.add_node("initialize_run", lambda state: initialize_run(state, db))
-    graph.add_node("fetch_tickets", lambda state: fetch_tickets(state, db))
-    graph.add_node("analyze_tickets", lambda state: analyze_tickets(state, db, langfuse_handler))
-    graph.add_node("generate_summary", lambda state: generate_summary(state, db))
-    graph.add_node("save_results", lambda state: save_results(state, db))
+    graph.add_node("validate_input", partial(validate_input, db=db))
+    graph.add_node("initialize_run", partial(initialize_run, db=db))
+    graph.add_node("fetch_tickets", partial(fetch_tickets, db=db))
+    graph.add_node(
+        "analyze_tickets",
+        partial(analyze_tickets, db=db, langfuse_handler=langfuse_handler)
+    )
+    # CACHE_DISABLED=true turns off every cache layer, including this one
+    summary_cache_policy = None if settings.cache_disabled else CachePolicy(
+        key_func=_generate_summary_cache_key, ttl=NODE_CACHE_TTL
+    )
+    graph.add_node(
+        "generate_summary",
+        partial(generate_summary, db=db),
+        cache_policy=summary_cache_policy
+    )
+    graph.add_node("save_results", partial(save_results, db=db))
     
     # Define edges (linear flow)
     graph.set_entry_point("validate_input")
@@ -38,7 +67,7 @@ def create_analysis_graph(db: Session, langfuse_handler: Optional[Any] = None) -
     graph.add_edge("generate_summary", "save_results")
     graph.add_edge("save_results", END)
     
-    return graph.compile()
+    return graph.compile(cache=None if settings.cache_disabled else _node_cache)
 
 
 def run_analysis(
@@ -58,15 +87,7 @@ def run_analysis(
         Dictionary with analysis_run_id and results
     """
     # Initialize state
-    initial_state: AnalysisState = {
-        "run_id": None,
-        "ticket_ids": ticket_ids or [],
-        "tickets": [],
-        "results": [],
-        "accumulated_summary": "",
-        "status": "pending",
-        "error": None
-    }
+    initial_state = AnalysisState(ticket_ids=ticket_ids or [])
     
     # Create graph
     graph = create_analysis_graph(db, langfuse_handler)
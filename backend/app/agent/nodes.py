@@ -1,10 +1,21 @@
 """LangGraph agent node implementations."""
 
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple, get_args
 from sqlalchemy.orm import Session
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError, APIConnectionError, InternalServerError
+import asyncio
+import httpx
+import hashlib
+import io
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import logging.handlers
+import queue
+import random
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from itertools import islice
 
 from app.agent.state import AnalysisState
 from app.agent.db_service import (
@@ -14,16 +25,464 @@ from app.agent.db_service import (
     update_analysis_run,
     save_ticket_analyses
 )
-from app.schemas import TicketAnalysisOutput
+from app.schemas import (
+    TicketAnalysisOutput,
+    TicketCategory,
+    TicketPriority,
+    parse_llm_output,
+    parse_llm_batch_output
+)
 from app.config import settings
 from app.api.exceptions import ValidationError, DatabaseError, LLMError
 
 # LangFuse tracing will be re-enabled after core analysis is working
 
+# Log records are handed to a background listener thread so worker code never
+# blocks on stream I/O; per-field detail goes to DEBUG
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+log = logging.getLogger("agent")
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+log.setLevel(logging.INFO)
+log.propagate = False
+
+LLM_MODEL = "openai/gpt-5-mini"
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+# Enum values read straight from the Literal annotations - no JSON-schema walk needed
+_CATEGORIES = list(get_args(TicketCategory))
+_PRIORITIES = list(get_args(TicketPriority))
+
+
+def _build_formatted_schema() -> dict:
+    """Build the OpenRouter response schema for a batch of ticket analyses.
+    
+    Generated from the Pydantic model so the schema always matches the model structure.
+    """
+    json_schema = TicketAnalysisOutput.model_json_schema()
+    
+    # OpenRouter requires specific format - extract and format the schema
+    # This ensures the schema matches the Pydantic model exactly
+    category_prop = json_schema["properties"]["category"]
+    priority_prop = json_schema["properties"]["priority"]
+    analysis_prop = json_schema["properties"]["analysis"]
+    causes_prop = json_schema["properties"]["potential_causes"]
+    solutions_prop = json_schema["properties"]["suggested_solutions"]
+    
+    analysis_item_schema = {
+        "type": "object",
+        "properties": {
+            "ticket_id": {
+                "type": "integer",
+                "description": "ID of the analyzed ticket"
+            },
+            "category": {
+                "type": "string",
+                "enum": _CATEGORIES,
+                "description": category_prop.get("description", "Category of the ticket")
+            },
+            "priority": {
+                "type": "string",
+                "enum": _PRIORITIES,
+                "description": priority_prop.get("description", "Priority level")
+            },
+            "analysis": {
+                "type": "string",
+                "minLength": analysis_prop.get("minLength", 10),
+                "maxLength": analysis_prop.get("maxLength", 500),
+                "description": analysis_prop.get("description", "Brief explanation of the issue")
+            },
+            "potential_causes": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "minLength": causes_prop["items"].get("minLength", 10),
+                    "maxLength": causes_prop["items"].get("maxLength", 150)
+                },
+                "minItems": causes_prop.get("minItems", 2),
+                "maxItems": causes_prop.get("maxItems", 3),
+                "description": causes_prop.get("description", "List of 2-3 potential root causes")
+            },
+            "suggested_solutions": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "minLength": solutions_prop["items"].get("minLength", 10),
+                    "maxLength": solutions_prop["items"].get("maxLength", 150)
+                },
+                "minItems": solutions_prop.get("minItems", 2),
+                "maxItems": solutions_prop.get("maxItems", 3),
+                "description": solutions_prop.get("description", "List of 2-3 suggested solutions")
+            }
+        },
+        "required": ["ticket_id"] + json_schema.get("required", ["category", "priority", "analysis", "potential_causes", "suggested_solutions"]),
+        "additionalProperties": False
+    }
+    
+    return {
+        "type": "object",
+        "properties": {
+            "analyses": {
+                "type": "array",
+                "items": analysis_item_schema,
+                "description": "One analysis per ticket in the request"
+            }
+        },
+        "required": ["analyses"],
+        "additionalProperties": False
+    }
+
+
+# Schema, system message and response format are identical for every request,
+# so they are built once at import instead of per LLM call
+_FORMATTED_SCHEMA = _build_formatted_schema()
+
+# Fixed instructions live in the system message so the per-batch user prompt only
+# carries ticket data; a stable prefix also hits provider-side prompt caching
+_SYSTEM_MESSAGE = (
+    "You are a support ticket analyst. Always respond with valid JSON only. "
+    "Never include markdown, explanations, or extra text. Ensure all strings are properly escaped. "
+    "The output will be validated against a strict schema.\n\n"
+    "For every ticket you are given, return exactly one entry in \"analyses\" with:\n"
+    "- ticket_id: the id of the ticket\n"
+    "- category: \"bug\", \"billing\", \"feature_request\" or \"other\"\n"
+    "- priority: \"low\", \"medium\" or \"high\"\n"
+    "- analysis: brief explanation of the issue (1-2 sentences, 10-500 characters)\n"
+    "- potential_causes: 2-3 likely root causes, each 10-150 characters\n"
+    "- suggested_solutions: 2-3 actionable next steps, each 10-150 characters"
+)
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "TicketAnalysisBatch",
+        "strict": True,
+        "schema": _FORMATTED_SCHEMA
+    }
+}
+
+# Provider rate-limit profiles keyed on base URL (requests and tokens per minute)
+PROVIDER_RATE_LIMITS = {
+    OPENROUTER_BASE_URL: {"rpm": 60, "tpm": 150_000},
+}
+DEFAULT_RATE_LIMITS = {"rpm": 60, "tpm": 150_000}
+
+
+class RateLimiter:
+    """Sliding-window request and token budget shared by all concurrent LLM calls.
+    
+    Requests are admitted only when both the RPM and TPM budgets for the last
+    60 seconds allow it, so bursts wait locally instead of hitting 429s.
+    """
+    
+    WINDOW_SECONDS = 60.0
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests: deque = deque()  # (timestamp, 1) per admitted request
+        self._tokens: deque = deque()  # [timestamp, tokens] per admission, corrected in place
+        self._token_total = 0
+        self._lock = asyncio.Lock()
+    
+    def _expire(self, now: float) -> None:
+        """Drop entries that have left the window."""
+        cutoff = now - self.WINDOW_SECONDS
+        while self._requests and self._requests[0][0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_total -= self._tokens.popleft()[1]
+    
+    async def acquire(self, estimated_tokens: int) -> list:
+        """Wait until a request of estimated_tokens fits in the current window.
+        
+        Returns the admitted token entry, to be passed to record() once usage is known.
+        """
+        # A single request larger than the whole budget must still be admissible
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if len(self._requests) < self.rpm and self._token_total + estimated_tokens <= self.tpm:
+                    entry = [now, estimated_tokens]
+                    self._requests.append((now, 1))
+                    self._tokens.append(entry)
+                    self._token_total += estimated_tokens
+                    return entry
+                # Sleep until the oldest entry leaves the window
+                oldest = min(entries[0][0] for entries in (self._requests, self._tokens) if entries)
+                await asyncio.sleep(max(oldest + self.WINDOW_SECONDS - now, 0.05))
+    
+    def record(self, entry: list, actual_tokens: int) -> None:
+        """Replace an admitted entry's estimate with actual usage.
+        
+        The entry keeps its admit timestamp, so the correction leaves the window
+        together with the estimate; entries that already expired are left alone.
+        """
+        # Entries are ordered by admit time: anything older than the head has expired
+        if not self._tokens or entry[0] < self._tokens[0][0]:
+            return
+        self._token_total += actual_tokens - entry[1]
+        entry[1] = actual_tokens
+
+
+_rate_limits = PROVIDER_RATE_LIMITS.get(OPENROUTER_BASE_URL, DEFAULT_RATE_LIMITS)
+_rate_limiter = RateLimiter(
+    rpm=settings.llm_rate_limit_rpm or _rate_limits["rpm"],
+    tpm=settings.llm_rate_limit_tpm or _rate_limits["tpm"],
+)
+
+# Shared OpenRouter client - created lazily so a missing API key doesn't fail at import
+_client: Optional[AsyncOpenAI] = None
+
+# Dedicated event loop for LLM fan-out. The graph runs synchronously (possibly from a
+# thread that already has a running loop), so coroutines are submitted to this loop
+# instead of asyncio.run(); it also keeps the async client's pool bound to one loop.
+_llm_loop: Optional[asyncio.AbstractEventLoop] = None
+_llm_loop_lock = threading.Lock()
+
+
+def _get_client() -> AsyncOpenAI:
+    """Return the shared async OpenAI client (OpenRouter compatible), reusing its connection pool across runs."""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(
+            base_url=OPENROUTER_BASE_URL,
+            api_key=settings.openrouter_api_key,
+            max_retries=0,  # Retries are handled by _stream_completion
+            # Keep-alive pool shared by concurrent requests and successive runs
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=httpx.Timeout(float(settings.llm_request_timeout))
+            )
+        )
+    return _client
+
+
+def _run_on_llm_loop(coro):
+    """Run a coroutine on the background LLM event loop and block until it completes."""
+    global _llm_loop
+    with _llm_loop_lock:
+        if _llm_loop is None:
+            _llm_loop = asyncio.new_event_loop()
+            threading.Thread(target=_llm_loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _llm_loop).result()
+
+
+# In-process LRU of validated analyses keyed on sha256(model + ticket prompt).
+# Re-running analysis over unchanged tickets skips the LLM entirely.
+_analysis_cache: "OrderedDict[str, str]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _ticket_payload(ticket: Any) -> dict:
+    """Ticket fields sent to the LLM (everything except the ID)."""
+    description = ticket.description
+    max_chars = settings.llm_max_description_chars
+    # Token-budget guard: very long descriptions are cut before they reach the prompt
+    if description and len(description) > max_chars:
+        description = description[:max_chars] + "… [truncated]"
+    return {
+        "title": ticket.title,
+        "description": description,
+        "status": ticket.status,
+        "tags": ticket.tags or "None"
+    }
+
+
+def _cache_key(ticket: Any) -> str:
+    """Content hash of the model and the ticket's prompt payload."""
+    payload = json.dumps(_ticket_payload(ticket), sort_keys=True)
+    return hashlib.sha256(f"{LLM_MODEL}|{payload}".encode()).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[TicketAnalysisOutput]:
+    """Return the cached analysis for key, or None on a miss or when caching is disabled."""
+    if settings.cache_disabled:
+        return None
+    with _analysis_cache_lock:
+        content = _analysis_cache.get(key)
+        if content is None:
+            return None
+        _analysis_cache.move_to_end(key)
+    return parse_llm_output(content)
+
+
+def _cache_put(key: str, content: str) -> None:
+    """Store a validated analysis JSON, evicting the least recently used entries."""
+    if settings.cache_disabled:
+        return
+    with _analysis_cache_lock:
+        _analysis_cache[key] = content
+        _analysis_cache.move_to_end(key)
+        while len(_analysis_cache) > settings.llm_cache_size:
+            _analysis_cache.popitem(last=False)
+
+
+def _to_result(ticket_id: int, analysis_output: TicketAnalysisOutput) -> dict:
+    """Convert a validated analysis into the result dict consumed by downstream nodes."""
+    return {
+        "ticket_id": ticket_id,
+        "category": analysis_output.category,
+        "priority": analysis_output.priority,
+        "analysis": analysis_output.analysis,
+        "potential_causes": analysis_output.potential_causes,
+        "suggested_solutions": analysis_output.suggested_solutions,
+        "notes": analysis_output.analysis,  # Keep for backward compatibility
+    }
+
+
+async def _stream_completion(client: AsyncOpenAI, estimated_tokens: int, **kwargs) -> Tuple[str, Any]:
+    """Stream a chat completion into a buffer, retrying transient failures with exponential backoff.
+    
+    Every attempt (retries included) reserves rate-limit budget first; the estimate
+    is replaced with actual usage on success.
+    Returns the full content and the usage block (sent with the final chunk).
+    Backoff is only a fallback - the rate limiter should keep 429s rare.
+    """
+    for attempt in range(settings.llm_max_retries + 1):
+        rate_entry = await _rate_limiter.acquire(estimated_tokens)
+        try:
+            content_buf = io.StringIO()
+            usage = None
+            stream = await client.chat.completions.create(
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content_buf.write(chunk.choices[0].delta.content)
+                if chunk.usage is not None:
+                    usage = chunk.usage
+            if usage is not None:
+                _rate_limiter.record(rate_entry, usage.total_tokens)
+            return content_buf.getvalue(), usage
+        except (RateLimitError, APIConnectionError, InternalServerError) as e:
+            if attempt == settings.llm_max_retries:
+                raise
+            delay = 2 ** attempt + random.random()
+            log.info("   ⏳ Transient LLM error (%s), retrying in %.1fs...", type(e).__name__, delay)
+            await asyncio.sleep(delay)
+
+
+def _build_batch_prompt(tickets_chunk: List[Any]) -> str:
+    """Marshal all tickets of a batch into one user prompt (ticket data only)."""
+    # Structure instructions are in _SYSTEM_MESSAGE and enforced by _RESPONSE_FORMAT
+    return "\n\n".join(
+        f"Ticket ID: {ticket.id}\n"
+        f"Title: {payload['title']}\n"
+        f"Description: {payload['description']}\n"
+        f"Status: {payload['status']}\n"
+        f"Tags: {payload['tags']}"
+        for ticket in tickets_chunk
+        for payload in (_ticket_payload(ticket),)
+    )
+
 
-def validate_input(state: AnalysisState, db: Session) -> AnalysisState:
+def _completion_params(tickets_chunk: List[Any], prompt: str) -> dict:
+    """Chat completion parameters for one ticket batch."""
+    return {
+        "model": LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": _SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt}
+        ],
+        "response_format": _RESPONSE_FORMAT,
+        # Output budget scales with the number of tickets in the batch
+        "max_tokens": 800 * len(tickets_chunk),
+        "temperature": 0.3,
+    }
+
+
+def _process_batch_content(
+    tickets_chunk: List[Any],
+    content: str,
+    input_tokens: int,
+    output_tokens: int
+) -> Tuple[List[dict], int, float]:
+    """Validate a batch response, fan it out per ticket and compute its cost."""
+    chunk_ids = [ticket.id for ticket in tickets_chunk]
+    log.debug("   ✅ Raw response received (%d chars)", len(content))
+    
+    # Validate response against Pydantic model
+    # This ensures the structure matches what frontend cards expect
+    try:
+        batch_output = parse_llm_batch_output(content)
+        log.debug("   ✅ Pydantic validation passed (%d analyses)", len(batch_output.analyses))
+    except Exception as json_err:
+        log.warning("   ⚠️ Pydantic validation error: %.200s", json_err)
+        log.debug("   📋 Content preview: %.500s", content)
+        raise ValidationError(f"Failed to validate LLM output against schema: {str(json_err)}")
+    
+    # Fan out analyses by ticket_id
+    analyses_by_id = {item.ticket_id: item for item in batch_output.analyses}
+    missing_ids = set(chunk_ids) - analyses_by_id.keys()
+    if missing_ids:
+        raise ValidationError(
+            "LLM response is missing ticket analyses",
+            f"Missing ticket IDs: {missing_ids}"
+        )
+    
+    # Track tokens and cost (based on OpenRouter pricing)
+    tokens_used = input_tokens + output_tokens
+    
+    # GPT-5-Mini pricing: $0.25/M input tokens, $2/M output tokens
+    input_cost = (input_tokens / 1_000_000) * 0.25
+    output_cost = (output_tokens / 1_000_000) * 2.0
+    cost = input_cost + output_cost
+    
+    # Store results and memoize each validated analysis
+    batch_results = []
+    for ticket in tickets_chunk:
+        analysis_output = analyses_by_id[ticket.id]
+        _cache_put(_cache_key(ticket), analysis_output.model_dump_json(exclude={"ticket_id"}))
+        batch_results.append(_to_result(ticket.id, analysis_output))
+    log.info("✅ Tickets %s analyzed successfully", chunk_ids)
+    return batch_results, tokens_used, cost
+
+
+async def analyze_ticket_batch(client: AsyncOpenAI, tickets_chunk: List[Any]) -> Tuple[List[dict], int, float]:
+    """Analyze a batch of tickets with a single LLM request (can be called in parallel).
+    
+    Returns:
+        Tuple of (per-ticket results, tokens used, cost)
+    """
+    chunk_ids = [ticket.id for ticket in tickets_chunk]
+    try:
+        log.info("📝 Analyzing tickets %s...", chunk_ids)
+        
+        prompt = _build_batch_prompt(tickets_chunk)
+        params = _completion_params(tickets_chunk, prompt)
+        
+        # Reserve rate-limit budget: rough prompt estimate (~4 chars/token) plus the full output budget
+        estimated_tokens = (len(_SYSTEM_MESSAGE) + len(prompt)) // 4 + params["max_tokens"]
+        
+        # Stream from OpenRouter with structured output mode using Pydantic-generated schema
+        content, usage = await _stream_completion(client, estimated_tokens, **params)
+        
+        # Parse the buffered response once for the whole batch
+        return _process_batch_content(
+            tickets_chunk,
+            content,
+            input_tokens=usage.prompt_tokens if usage else 0,
+            output_tokens=usage.completion_tokens if usage else 0
+        )
+        
+    except Exception as e:
+        log.exception("❌ Error analyzing tickets %s: %s", chunk_ids, e)
+        raise LLMError(
+            f"Failed to analyze tickets {chunk_ids}",
+            str(e)
+        )
+
+
+def validate_input(state: AnalysisState, db: Session) -> dict:
     """Node 1: Validate input ticket IDs."""
-    ticket_ids = state.get("ticket_ids", [])
+    ticket_ids = state.ticket_ids
     
     if ticket_ids:
         # Check if tickets exist
@@ -35,304 +494,177 @@ def validate_input(state: AnalysisState, db: Session) -> AnalysisState:
                 f"Some ticket IDs not found",
                 f"Missing ticket IDs: {missing_ids}"
             )
+        
+        # Reuse the fetched rows in fetch_tickets instead of querying again
+        return {"tickets": tickets, "status": "validated"}
     
-    state["status"] = "validated"
-    return state
+    return {"status": "validated"}
 
 
-def initialize_run(state: AnalysisState, db: Session) -> AnalysisState:
+def initialize_run(state: AnalysisState, db: Session) -> dict:
     """Node 2: Initialize analysis run."""
     analysis_run = create_analysis_run(db, summary="")
-    state["run_id"] = analysis_run.id
-    state["status"] = "run_created"
-    return state
+    return {"run_id": analysis_run.id, "status": "run_created"}
 
 
-def fetch_tickets(state: AnalysisState, db: Session) -> AnalysisState:
+def fetch_tickets(state: AnalysisState, db: Session) -> dict:
     """Node 3: Fetch tickets from database."""
-    ticket_ids = state.get("ticket_ids", [])
+    ticket_ids = state.ticket_ids
     
-    if ticket_ids:
+    if state.tickets:
+        # Already loaded by validate_input
+        tickets = state.tickets
+    elif ticket_ids:
         tickets = get_tickets_by_ids(db, ticket_ids)
     else:
-        tickets = get_all_tickets(db)
+        # Stream rows instead of materializing the whole table, honouring the per-run cap
+        tickets_iter = get_all_tickets(db)
+        try:
+            tickets = list(islice(tickets_iter, settings.max_tickets_per_run))
+        finally:
+            tickets_iter.close()
     
     if not tickets:
         raise ValidationError("No tickets found to analyze")
     
-    state["tickets"] = tickets
-    state["ticket_ids"] = [t.id for t in tickets]
-    state["status"] = "tickets_fetched"
-    return state
+    return {
+        "tickets": tickets,
+        "ticket_ids": [t.id for t in tickets],
+        "status": "tickets_fetched"
+    }
+
+
+async def _gather_with_sem(client: AsyncOpenAI, chunks: List[List[Any]]) -> List[Tuple[List[dict], int, float]]:
+    """Analyze all batches concurrently, bounded by llm_max_concurrency in-flight requests.
+    
+    Batches are collected in completion order, so a slow batch doesn't hold up the others;
+    on the first failure the remaining batches are cancelled.
+    """
+    sem = asyncio.Semaphore(max(settings.llm_max_concurrency, 1))
+    
+    async def bounded(chunk):
+        async with sem:
+            return await analyze_ticket_batch(client, chunk)
+    
+    tasks = [asyncio.ensure_future(bounded(chunk)) for chunk in chunks]
+    outputs = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            outputs.append(await next_done)
+            log.info("   📦 %d/%d batches complete", len(outputs), len(tasks))
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        raise
+    return outputs
 
 
-def analyze_tickets(state: AnalysisState, db: Session, langfuse_handler: Optional[object] = None) -> AnalysisState:
-    """Node 4: Analyze each ticket using OpenRouter API."""
+def analyze_tickets(state: AnalysisState, db: Session, langfuse_handler: Optional[object] = None) -> dict:
+    """Node 4: Analyze tickets in batches using OpenRouter API."""
     if not settings.openrouter_api_key:
         raise LLMError("OpenRouter API key not configured")
     
-    print(f"🔍 Starting analysis of {len(state['tickets'])} tickets...")
+    log.info("🔍 Starting analysis of %d tickets...", len(state.tickets))
     
-    tickets = state["tickets"]
+    tickets = state.tickets
     results = []
     total_tokens_used = 0
     total_cost = 0.0
     
-    # Initialize OpenAI client (OpenRouter compatible)
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=settings.openrouter_api_key,
-    )
+    # Serve unchanged tickets from the cache, only send misses to the LLM
+    uncached_tickets = []
+    for ticket in tickets:
+        cached_output = _cache_get(_cache_key(ticket))
+        if cached_output is not None:
+            results.append(_to_result(ticket.id, cached_output))
+        else:
+            uncached_tickets.append(ticket)
     
-    def analyze_single_ticket(ticket):
-        """Analyze a single ticket (can be called in parallel)."""
-        try:
-            print(f"📝 Analyzing ticket {ticket.id}...")
-            
-            # Prepare prompt with clear JSON structure instructions
-            prompt = f"""You are a support ticket analyst. Analyze this ticket and respond ONLY with valid JSON.
-
-Ticket:
-Title: {ticket.title}
-Description: {ticket.description}
-Status: {ticket.status}
-Tags: {ticket.tags or 'None'}
-
-Respond with ONLY this JSON structure (no markdown, no extra text):
-{{
-  "category": "bug" or "billing" or "feature_request" or "other",
-  "priority": "low" or "medium" or "high",
-  "analysis": "brief explanation of the issue (1-2 sentences)",
-  "potential_causes": ["cause 1", "cause 2", "cause 3"],
-  "suggested_solutions": ["solution 1", "solution 2", "solution 3"]
-}}"""
-
-            # Generate JSON schema from Pydantic model
-            # This ensures the schema always matches the model structure
-            json_schema = TicketAnalysisOutput.model_json_schema()
-            
-            # Extract enum values from Literal types (Pydantic v2 represents them as "anyOf" with "const")
-            def extract_enum_from_schema(prop_schema: dict) -> list:
-                """Extract enum values from Pydantic Literal type schema."""
-                if "enum" in prop_schema:
-                    return prop_schema["enum"]
-                elif "anyOf" in prop_schema:
-                    # Pydantic v2 represents Literal as anyOf with const values
-                    return [item["const"] for item in prop_schema["anyOf"] if "const" in item]
-                return []
-            
-            # OpenRouter requires specific format - extract and format the schema
-            # This ensures the schema matches the Pydantic model exactly
-            category_prop = json_schema["properties"]["category"]
-            priority_prop = json_schema["properties"]["priority"]
-            analysis_prop = json_schema["properties"]["analysis"]
-            causes_prop = json_schema["properties"]["potential_causes"]
-            solutions_prop = json_schema["properties"]["suggested_solutions"]
-            
-            formatted_schema = {
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "enum": extract_enum_from_schema(category_prop) or ["bug", "billing", "feature_request", "other"],
-                        "description": category_prop.get("description", "Category of the ticket")
-                    },
-                    "priority": {
-                        "type": "string",
-                        "enum": extract_enum_from_schema(priority_prop) or ["low", "medium", "high"],
-                        "description": priority_prop.get("description", "Priority level")
-                    },
-                    "analysis": {
-                        "type": "string",
-                        "minLength": analysis_prop.get("minLength", 10),
-                        "maxLength": analysis_prop.get("maxLength", 500),
-                        "description": analysis_prop.get("description", "Brief explanation of the issue")
-                    },
-                    "potential_causes": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "minLength": 10,
-                            "maxLength": 150
-                        },
-                        "minItems": causes_prop.get("minItems", 2),
-                        "maxItems": causes_prop.get("maxItems", 3),
-                        "description": causes_prop.get("description", "List of 2-3 potential root causes")
-                    },
-                    "suggested_solutions": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "minLength": 10,
-                            "maxLength": 150
-                        },
-                        "minItems": solutions_prop.get("minItems", 2),
-                        "maxItems": solutions_prop.get("maxItems", 3),
-                        "description": solutions_prop.get("description", "List of 2-3 suggested solutions")
-                    }
-                },
-                "required": json_schema.get("required", ["category", "priority", "analysis", "potential_causes", "suggested_solutions"]),
-                "additionalProperties": False
-            }
-            
-            # Call OpenRouter with structured output mode using Pydantic-generated schema
-            response = client.beta.chat.completions.create(
-                model="openai/gpt-5-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a support ticket analyst. Always respond with valid JSON only. Never include markdown, explanations, or extra text. Ensure all strings are properly escaped. The output will be validated against a strict schema."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "TicketAnalysis",
-                        "strict": True,
-                        "schema": formatted_schema
-                    }
-                },
-                max_tokens=800,
-                temperature=0.3,
-            )
-            
-            # Parse response
-            content = response.choices[0].message.content
-            print(f"   ✅ Raw response received ({len(content)} chars)")
-            
-            # Validate response against Pydantic model
-            # This ensures the structure matches what frontend cards expect
-            try:
-                analysis_output = TicketAnalysisOutput.model_validate_json(content)
-                print(f"   ✅ Pydantic validation passed")
-                print(f"      Category: {analysis_output.category} -> Categories card")
-                print(f"      Priority: {analysis_output.priority} -> Priority card")
-                print(f"      Analysis: {len(analysis_output.analysis)} chars -> Detailed Analysis card")
-                print(f"      Causes: {len(analysis_output.potential_causes)} items -> Detailed Analysis card")
-                print(f"      Solutions: {len(analysis_output.suggested_solutions)} items -> Detailed Analysis card")
-            except Exception as json_err:
-                print(f"   ⚠️ Pydantic validation error: {str(json_err)[:200]}")
-                print(f"   📋 Content preview: {content[:500]}")
-                raise ValidationError(f"Failed to validate LLM output against schema: {str(json_err)}")
-            
-            # Track tokens and cost (based on OpenRouter pricing)
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            tokens_used = input_tokens + output_tokens
-            
-            # GPT-5-Mini pricing: $0.25/M input tokens, $2/M output tokens
-            input_cost = (input_tokens / 1_000_000) * 0.25
-            output_cost = (output_tokens / 1_000_000) * 2.0
-            cost = input_cost + output_cost
-            
-            # Store result
-            result = {
-                "ticket_id": ticket.id,
-                "category": analysis_output.category,
-                "priority": analysis_output.priority,
-                "analysis": analysis_output.analysis,
-                "potential_causes": analysis_output.potential_causes,
-                "suggested_solutions": analysis_output.suggested_solutions,
-                "notes": analysis_output.analysis,  # Keep for backward compatibility
-                "tokens": tokens_used,
-                "cost": cost
-            }
-            print(f"✅ Ticket {ticket.id} analyzed successfully")
-            return result
-            
-        except Exception as e:
-            print(f"❌ Error analyzing ticket {ticket.id}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            raise LLMError(
-                f"Failed to analyze ticket {ticket.id}",
-                str(e)
-            )
+    if results:
+        log.info("   ♻️  %d tickets served from cache", len(results))
     
-    # Analyze tickets in parallel (max 5 concurrent)
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(analyze_single_ticket, ticket): ticket for ticket in tickets}
-        
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                tokens = result.pop("tokens", 0)
-                cost = result.pop("cost", 0.0)
-                results.append(result)
-                total_tokens_used += tokens
-                total_cost += cost
-            except Exception as e:
-                # Error is already printed in analyze_single_ticket
-                raise
+    client = _get_client()
+    
+    # Group tickets into batches of llm_batch_size
+    ticket_iter = iter(uncached_tickets)
+    chunks = []
+    while chunk := list(islice(ticket_iter, max(settings.llm_batch_size, 1))):
+        chunks.append(chunk)
+    
+    # Analyze batches concurrently on one event loop (errors are logged in analyze_ticket_batch)
+    batch_outputs = _run_on_llm_loop(_gather_with_sem(client, chunks))
     
-    state["results"] = results
-    state["total_tokens_used"] = total_tokens_used
-    state["total_cost"] = total_cost
-    state["status"] = "analyzed"
-    return state
+    for batch_results, tokens, cost in batch_outputs:
+        results.extend(batch_results)
+        total_tokens_used += tokens
+        total_cost += cost
+    
+    return {
+        "results": results,
+        "total_tokens_used": total_tokens_used,
+        "total_cost": total_cost,
+        "status": "analyzed"
+    }
 
 
-def generate_summary(state: AnalysisState, db: Session) -> AnalysisState:
+def generate_summary(state: AnalysisState, db: Session) -> dict:
     """Node 5: Generate overall summary from all analyses using agent-driven logic."""
-    results = state["results"]
-    tickets = state["tickets"]
+    results = state.results
+    tickets = state.tickets
     
     if not results:
-        state["accumulated_summary"] = "No tickets analyzed."
-        state["status"] = "summarized"
-        return state
+        return {"accumulated_summary": "No tickets analyzed.", "status": "summarized"}
     
     try:
         # Agent-driven summary: dynamically analyze the data without hardcoding
-        category_counts: dict = {}
-        priority_counts: dict = {}
+        category_counts: Counter = Counter()
+        priority_counts: Counter = Counter()
+        problem_themes = []
         
-        # Aggregate all results
+        # Aggregate all results in a single pass
         for result in results:
-            cat = result['category']
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-            priority_counts[result['priority']] = priority_counts.get(result['priority'], 0) + 1
+            category_counts[result['category']] += 1
+            priority_counts[result['priority']] += 1
+            
+            # Problem overview: try to get analysis, fall back to notes
+            if len(problem_themes) < 5:  # Collect up to 5 key issues
+                analysis_text = result.get('analysis') or result.get('notes')
+                if analysis_text:
+                    # Extract first sentence or first 80 chars (single scan, stops at the first '.')
+                    head, sep, _ = analysis_text.partition('.')
+                    sentence = head if sep else analysis_text[:80]
+                    if sentence.strip() and sentence not in problem_themes:
+                        problem_themes.append(sentence.strip())
         
-        # Calculate statistics
-        top_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
+        n = len(results)
+        inv_n = 100.0 / n  # Percentages become a multiply
         
         # Build dynamic summary based on the actual data patterns
         summary_parts = []
         
         # Part 1: Overall count
-        summary_parts.append(f"Analyzed {len(results)} support ticket{'s' if len(results) != 1 else ''}.")
+        summary_parts.append(f"Analyzed {n} support ticket{'s' if n != 1 else ''}.")
         
-        # Part 2: Category distribution
+        # Part 2: Category distribution (top 5 categories)
+        top_categories = category_counts.most_common(5)
         if top_categories:
-            category_descriptions = []
-            for cat, count in top_categories[:5]:  # Top 5 categories
-                pct = (count / len(results)) * 100
-                category_descriptions.append(f"{count} {cat.replace('_', ' ')} ({pct:.0f}%)")
+            category_descriptions = [
+                f"{count} {cat.replace('_', ' ')} ({count * inv_n:.0f}%)"
+                for cat, count in top_categories
+            ]
             summary_parts.append(f"Categories: {', '.join(category_descriptions)}.")
         
         # Part 3: Priority breakdown
         priority_summary = []
         for priority in ['high', 'medium', 'low']:
-            count = priority_counts.get(priority, 0)
+            count = priority_counts[priority]
             if count > 0:
-                pct = (count / len(results)) * 100
-                priority_summary.append(f"{count} {priority}-priority ({pct:.0f}%)")
+                priority_summary.append(f"{count} {priority}-priority ({count * inv_n:.0f}%)")
         
         if priority_summary:
             summary_parts.append(f"Priority breakdown: {', '.join(priority_summary)}.")
         
-        # Part 4: Problem overview from ALL ticket analysis
-        problem_themes = []
-        for result in results:  # Iterate through ALL tickets
-            # Try to get analysis, fall back to notes
-            analysis_text = result.get('analysis') or result.get('notes')
-            if analysis_text and len(problem_themes) < 5:  # Collect up to 5 key issues
-                # Extract first sentence or first 50 chars
-                sentence = analysis_text.split('.')[0] if '.' in analysis_text else analysis_text[:80]
-                if sentence.strip() and sentence not in problem_themes:
-                    problem_themes.append(sentence.strip())
-        
+        # Part 4: Key issues collected during aggregation
         if problem_themes:
             # If more than 3, show first few, then indicate there are more
             if len(problem_themes) > 3:
@@ -342,44 +674,40 @@ def generate_summary(state: AnalysisState, db: Session) -> AnalysisState:
             summary_parts.append(f"Key issues: {issues_text}.")
         
         # Part 6: Actionable insights
-        high_priority_count = priority_counts.get('high', 0)
+        high_priority_count = priority_counts['high']
         if high_priority_count > 0:
             summary_parts.append(f"⚠️  {high_priority_count} high-priority issue{'s' if high_priority_count != 1 else ''} require{'s' if high_priority_count == 1 else ''} immediate attention.")
         
         # Combine all parts
         summary = " ".join(summary_parts)
         
-        state["accumulated_summary"] = summary
-        state["status"] = "summarized"
-        
     except Exception as e:
         # Fallback to basic summary
-        state["accumulated_summary"] = f"Analyzed {len(results)} support tickets."
-        state["status"] = "summarized"
+        summary = f"Analyzed {len(results)} support tickets."
     
-    return state
+    return {"accumulated_summary": summary, "status": "summarized"}
 
 
-def save_results(state: AnalysisState, db: Session) -> AnalysisState:
+def save_results(state: AnalysisState, db: Session) -> dict:
     """Node 6: Save all results to database."""
-    run_id = state["run_id"]
-    summary = state["accumulated_summary"]
-    results = state["results"]
+    run_id = state.run_id
+    summary = state.accumulated_summary
+    results = state.results
     
     try:
-        # Update analysis run
+        # Run update and analysis inserts share one transaction (single commit)
         update_analysis_run(
             db=db,
             run_id=run_id,
             summary=summary,
-            status="completed"
+            status="completed",
+            commit=False
         )
+        save_ticket_analyses(db=db, run_id=run_id, analyses=results, commit=False)
+        db.commit()
         
-        # Save ticket analyses
-        save_ticket_analyses(db=db, run_id=run_id, analyses=results)
-        
-        state["status"] = "saved"
-        return state
+        return {"status": "saved"}
 
     except Exception as e:
+        db.rollback()
         raise DatabaseError(f"Failed to save analysis results: {str(e)}")
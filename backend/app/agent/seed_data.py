@@ -1,8 +1,14 @@
 """Seed sample tickets on application startup."""
 
+import asyncio
+
 from sqlalchemy.orm import Session
 from app.models import Ticket, AnalysisRun, TicketAnalysis
-from sqlalchemy import func
+from sqlalchemy import func, insert, delete
+from app.schemas import BULK_TICKET_ADAPTER, validate_bulk
+
+# Set once startup seeding has finished (or is disabled); /api/analyze waits on it
+seed_done = asyncio.Event()
 
 # 20 Sample tickets with status distribution: Open (10), In Progress (5), Resolved (5)
 # Categories balanced across all tickets: Bug (5), Billing (5), Feature Request (5), Other (5)
@@ -139,8 +145,9 @@ def seed_database(db: Session):
     try:
         # Always clear analysis tables on startup to ensure clean state
         print("🧹 Clearing analysis tables (analysis_runs and ticket_analysis)...")
-        db.query(TicketAnalysis).delete()
-        db.query(AnalysisRun).delete()
+        # Core DELETEs skip the ORM session synchronization of query().delete()
+        db.execute(delete(TicketAnalysis))
+        db.execute(delete(AnalysisRun))
         db.commit()
         print("✅ Analysis tables cleared!")
         
@@ -153,15 +160,9 @@ def seed_database(db: Session):
         
         print("🌱 Seeding database with 20 sample tickets...")
         
-        for ticket_data in SAMPLE_TICKETS:
-            ticket = Ticket(
-                title=ticket_data["title"],
-                description=ticket_data["description"],
-                status=ticket_data["status"],
-                tags=ticket_data["tags"]
-            )
-            db.add(ticket)
-        
+        # Validate all rows in one pass, then a single multi-row INSERT
+        rows = BULK_TICKET_ADAPTER.dump_python(validate_bulk(SAMPLE_TICKETS))
+        db.execute(insert(Ticket), rows)
         db.commit()
         print(f"✅ Successfully seeded {len(SAMPLE_TICKETS)} tickets!")
         
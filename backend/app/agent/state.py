@@ -1,16 +1,23 @@
 """LangGraph agent state definition."""
 
-from typing import TypedDict, List, Optional
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from app.models import Ticket
 
 
-class AnalysisState(TypedDict):
-    """State for the ticket analysis agent."""
-    run_id: Optional[int]
-    ticket_ids: List[int]
-    tickets: List[Ticket]
-    results: List[dict]  # List of TicketAnalysisOutput dicts
-    accumulated_summary: str
-    status: str
-    error: Optional[str]
-
+class AnalysisState(BaseModel):
+    """State for the ticket analysis agent.
+    
+    Nodes read attributes and return dicts of the keys they update.
+    """
+    model_config = ConfigDict(frozen=False, arbitrary_types_allowed=True)
+    
+    run_id: Optional[int] = None
+    ticket_ids: List[int] = Field(default_factory=list)
+    tickets: List[Ticket] = Field(default_factory=list)
+    results: List[dict] = Field(default_factory=list)  # List of TicketAnalysisOutput dicts
+    accumulated_summary: str = ""
+    total_tokens_used: int = 0
+    total_cost: float = 0.0
+    status: str = "pending"
+    error: Optional[str] = None
@@ -1,12 +1,11 @@
 """Custom exception classes and error handlers."""
 
-from datetime import datetime, timezone
 from typing import Optional
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
-from app.schemas import ErrorResponse, ErrorDetail
+from app.schemas import ErrorResponse, ErrorDetail, ERROR_RESPONSE_ADAPTER
 
 
 class AppException(Exception):
@@ -49,7 +48,7 @@ class GraphExecutionError(AppException):
         super().__init__("GRAPH_EXECUTION_ERROR", message, details, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
     """Handle application exceptions."""
     error_response = ErrorResponse(
         error=ErrorDetail(
@@ -57,16 +56,15 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
             message=exc.message,
             details=exc.details
         ),
-        trace_id=getattr(request.state, "trace_id", None),
-        timestamp=datetime.now(timezone.utc)
+        trace_id=getattr(request.state, "trace_id", None)
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump(mode='json')  # Use mode='json' to serialize datetime
+        content=ERROR_RESPONSE_ADAPTER.dump_python(error_response)  # orjson serializes datetime natively
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
     errors = exc.errors()
     error_details = "; ".join([f"{err['loc']}: {err['msg']}" for err in errors])
@@ -77,11 +75,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             message="Invalid request format",
             details=error_details
         ),
-        trace_id=getattr(request.state, "trace_id", None),
-        timestamp=datetime.now(timezone.utc)
+        trace_id=getattr(request.state, "trace_id", None)
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_response.model_dump(mode='json')  # Use mode='json' to serialize datetime
+        content=ERROR_RESPONSE_ADAPTER.dump_python(error_response)  # orjson serializes datetime natively
     )
 
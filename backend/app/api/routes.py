@@ -1,11 +1,18 @@
 """API route handlers."""
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select, desc
+import asyncio
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Union
 
-from app.database import get_db
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, desc, insert, func, case, bindparam
+from sqlalchemy.orm import selectinload
+
+from app.database import get_db, SessionLocal, AsyncSessionLocal
 from app.models import Ticket, AnalysisRun, TicketAnalysis
 from app.schemas import (
     TicketCreate,
@@ -13,11 +20,12 @@ from app.schemas import (
     TicketResponse,
     AnalyzeRequest,
     AnalyzeResponse,
-    AnalysisRunResponse,
-    TicketAnalysisResponse,
-    AnalysisHistoryResponse
+    AnalysisHistoryResponse,
+    TICKET_LIST_ADAPTER
 )
 from app.agent.graph import run_analysis
+from app.agent.cache import analysis_cache, analysis_cache_key
+from app.agent.seed_data import seed_done
 from app.api.exceptions import (
     ValidationError,
     NotFoundError,
@@ -25,16 +33,99 @@ from app.api.exceptions import (
     LLMError,
     GraphExecutionError
 )
-from app.config import settings
+from app.config import Settings, get_settings
 
 router = APIRouter(prefix="/api", tags=["api"])
 
+# Hot statements built once at import; values are bound per request, so each
+# compiles once and is then served from the engine's compiled-statement cache
+RUN_WITH_ANALYSES_STMT = select(AnalysisRun).options(
+    selectinload(AnalysisRun.ticket_analyses)
+).where(AnalysisRun.id == bindparam("run_id"))
+
+RUN_HEADER_STMT = select(
+    AnalysisRun.created_at, AnalysisRun.status
+).where(AnalysisRun.id == bindparam("run_id"))
+
+LATEST_RUN_HEADER_STMT = select(
+    AnalysisRun.id, AnalysisRun.created_at, AnalysisRun.status
+).order_by(desc(AnalysisRun.created_at)).limit(1)
+
+RUN_HISTORY_STMT = select(AnalysisRun).order_by(
+    desc(AnalysisRun.created_at)
+).limit(bindparam("limit")).offset(bindparam("offset"))
+
+TICKETS_STMT = select(Ticket).order_by(desc(Ticket.created_at))
+
+_category_count = func.count()
+CATEGORY_COUNTS_STMT = select(TicketAnalysis.category, _category_count).where(
+    TicketAnalysis.analysis_run_id == bindparam("run_id")
+).group_by(TicketAnalysis.category).order_by(desc(_category_count), TicketAnalysis.category)
+
+# Priority buckets ranked high > medium > low
+_priority_rank = case({"high": 3, "medium": 2, "low": 1}, value=TicketAnalysis.priority, else_=0)
+PRIORITY_COUNTS_STMT = select(TicketAnalysis.priority, func.count()).where(
+    TicketAnalysis.analysis_run_id == bindparam("run_id")
+).group_by(TicketAnalysis.priority).order_by(desc(_priority_rank))
+
+
+def _run_analysis_in_session(ticket_ids: Optional[List[int]]) -> dict:
+    """Run the LangGraph agent with a dedicated sync session (called off the event loop)."""
+    db = SessionLocal()
+    try:
+        return run_analysis(
+            ticket_ids=ticket_ids,
+            db=db,
+            langfuse_handler=None
+        )
+    finally:
+        db.close()
+
+
+def _json_response(
+    content: Union[str, bytes],
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[dict] = None
+) -> Response:
+    """Send already-serialized JSON, skipping FastAPI's response_model re-validation."""
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def _analysis_run_etag(run_id: int, created_at: datetime, run_status: str) -> str:
+    """Weak ETag for a run; status is included because in-progress runs still change."""
+    return f'W/"{run_id}-{int(created_at.timestamp())}-{run_status}"'
+
+
+# Always revalidate: startup seeding deletes runs and IDs get reused, so even a completed
+# run's URL can change content. Unchanged runs are still cheap via the ETag/304 path.
+ANALYSIS_RUN_CACHE_CONTROL = "no-cache"
+
+
+async def _load_analysis_response(db: AsyncSession, run_id: int) -> Optional[AnalyzeResponse]:
+    """Load a run with its ticket analyses eager-loaded, or None if it doesn't exist."""
+    result = await db.execute(RUN_WITH_ANALYSES_STMT, {"run_id": run_id})
+    analysis_run = result.scalar_one_or_none()
+    
+    if not analysis_run:
+        return None
+    
+    # One validation pass builds the run and its analyses straight from the ORM objects
+    return AnalyzeResponse.model_validate(
+        {"analysis_run": analysis_run, "ticket_analyses": analysis_run.ticket_analyses},
+        from_attributes=True
+    )
+
 
 @router.post("/tickets", response_model=List[TicketResponse], status_code=status.HTTP_201_CREATED)
 async def create_tickets(
     tickets: List[TicketCreate],
-    db: Session = Depends(get_db)
-) -> List[TicketResponse]:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Create one or more support tickets.
     
@@ -49,45 +140,60 @@ async def create_tickets(
         raise ValidationError("At least one ticket is required")
     
     try:
-        created_tickets = []
-        for ticket_data in tickets:
-            ticket = Ticket(
-                title=ticket_data.title,
-                description=ticket_data.description,
-                status=ticket_data.status or "open",
-                tags=ticket_data.tags
-            )
-            db.add(ticket)
-            created_tickets.append(ticket)
-        
-        db.commit()
+        values = [
+            {
+                "title": ticket_data.title,
+                "description": ticket_data.description,
+                "status": ticket_data.status or "open",
+                "tags": ticket_data.tags
+            }
+            for ticket_data in tickets
+        ]
         
-        # Refresh all tickets
-        for ticket in created_tickets:
-            db.refresh(ticket)
+        # Single bulk INSERT ... RETURNING picks up server-generated ids/timestamps
+        result = await db.execute(
+            insert(Ticket).returning(Ticket, sort_by_parameter_order=True),
+            values
+        )
+        created_tickets = result.scalars().all()
+        await db.commit()
         
-        return [TicketResponse.model_validate(ticket) for ticket in created_tickets]
+        return _json_response(
+            TICKET_LIST_ADAPTER.dump_json(
+                TICKET_LIST_ADAPTER.validate_python(created_tickets, from_attributes=True)
+            ),
+            status_code=status.HTTP_201_CREATED
+        )
     
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise DatabaseError(f"Failed to create tickets: {str(e)}")
 
 
 @router.post("/analyze", response_model=AnalyzeResponse, status_code=status.HTTP_200_OK)
 async def analyze_tickets(
     request: AnalyzeRequest,
-    db: Session = Depends(get_db)
-) -> AnalyzeResponse:
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings)
+) -> Response:
     """
     Analyze tickets using LangGraph agent.
     
     Args:
         request: Analysis request with optional ticket IDs
         db: Database session
+        settings: Application settings
     
     Returns:
         Analysis run with ticket analyses
     """
+    # Startup seeding clears analysis tables, so don't analyze until it has finished
+    if not seed_done.is_set():
+        raise LLMError(
+            "Seeding in progress",
+            "Database seeding is still running; retry in a few seconds"
+        )
+    
     # Check if OpenRouter API key is configured
     if not settings.openrouter_api_key:
         raise LLMError(
@@ -98,32 +204,30 @@ async def analyze_tickets(
     ticket_ids = request.ticket_ids if request.ticket_ids else None
     
     try:
-        # Run LangGraph agent
-        result = run_analysis(
-            ticket_ids=ticket_ids,
-            db=db,
-            langfuse_handler=None
-        )
+        # Skip the graph entirely when the same tickets (unchanged) were analyzed recently
+        stmt = select(Ticket.id, Ticket.updated_at)
+        if ticket_ids:
+            stmt = stmt.where(Ticket.id.in_(ticket_ids))
+        versions_result = await db.execute(stmt)
+        cache_key = analysis_cache_key(ticket_ids, versions_result.all())
+        # End the autobegun read transaction so the connection isn't held idle in
+        # transaction for the whole LLM run
+        await db.rollback()
+        cached_response = analysis_cache.get(cache_key)
+        if cached_response is not None:
+            return _json_response(cached_response.model_dump_json())
         
-        # Fetch the analysis run
-        stmt = select(AnalysisRun).where(AnalysisRun.id == result["run_id"])
-        analysis_run_result = db.execute(stmt)
-        analysis_run = analysis_run_result.scalar_one_or_none()
+        # Run the (synchronous) LangGraph agent in a worker thread with its own session
+        result = await asyncio.to_thread(_run_analysis_in_session, ticket_ids)
         
-        if not analysis_run:
-            raise NotFoundError(f"Analysis run {result['run_id']} not found")
+        # Fetch the analysis run with its ticket analyses
+        response = await _load_analysis_response(db, result["run_id"])
         
-        # Fetch ticket analyses
-        stmt = select(TicketAnalysis).where(
-            TicketAnalysis.analysis_run_id == result["run_id"]
-        ).order_by(TicketAnalysis.id)
-        analyses_result = db.execute(stmt)
-        ticket_analyses = list(analyses_result.scalars().all())
+        if response is None:
+            raise NotFoundError(f"Analysis run {result['run_id']} not found")
         
-        return AnalyzeResponse(
-            analysis_run=AnalysisRunResponse.model_validate(analysis_run),
-            ticket_analyses=[TicketAnalysisResponse.model_validate(ta) for ta in ticket_analyses]
-        )
+        analysis_cache.set(cache_key, response)
+        return _json_response(response.model_dump_json())
     
     except (ValidationError, NotFoundError, LLMError, GraphExecutionError):
         # Re-raise our custom exceptions
@@ -138,37 +242,43 @@ async def analyze_tickets(
 @router.get("/analysis/runs/{run_id}", response_model=AnalyzeResponse, status_code=status.HTTP_200_OK)
 async def get_analysis_run(
     run_id: int,
-    db: Session = Depends(get_db)
-) -> AnalyzeResponse:
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Get a specific analysis run with all its ticket analyses.
     
+    Honors If-None-Match: an unchanged run is answered with 304 before its analyses are loaded.
+    
     Args:
         run_id: Analysis run ID
+        request: Incoming request (for If-None-Match)
         db: Database session
     
     Returns:
         Analysis run with ticket analyses
     """
     try:
-        # Get the analysis run
-        stmt = select(AnalysisRun).where(AnalysisRun.id == run_id)
-        result = db.execute(stmt)
-        analysis_run = result.scalar_one_or_none()
+        # Cheap header lookup first for the ETag
+        header = (await db.execute(RUN_HEADER_STMT, {"run_id": run_id})).one_or_none()
         
-        if not analysis_run:
+        if not header:
             raise NotFoundError(f"Analysis run {run_id} not found")
         
-        # Get ticket analyses for this run
-        stmt = select(TicketAnalysis).where(
-            TicketAnalysis.analysis_run_id == run_id
-        ).order_by(TicketAnalysis.id)
-        analyses_result = db.execute(stmt)
-        ticket_analyses = list(analyses_result.scalars().all())
+        etag = _analysis_run_etag(run_id, header.created_at, header.status)
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": ANALYSIS_RUN_CACHE_CONTROL}
+            )
         
-        return AnalyzeResponse(
-            analysis_run=AnalysisRunResponse.model_validate(analysis_run),
-            ticket_analyses=[TicketAnalysisResponse.model_validate(ta) for ta in ticket_analyses]
+        analyze_response = await _load_analysis_response(db, run_id)
+        if analyze_response is None:
+            raise NotFoundError(f"Analysis run {run_id} not found")
+        
+        return _json_response(
+            analyze_response.model_dump_json(),
+            headers={"ETag": etag, "Cache-Control": ANALYSIS_RUN_CACHE_CONTROL}
         )
     
     except NotFoundError:
@@ -179,38 +289,44 @@ async def get_analysis_run(
 
 @router.get("/analysis/latest", response_model=AnalyzeResponse, status_code=status.HTTP_200_OK)
 async def get_latest_analysis(
-    db: Session = Depends(get_db)
-) -> AnalyzeResponse:
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Get the latest analysis run with all ticket analyses.
     
+    Honors If-None-Match like get_analysis_run; always revalidated since "latest" moves.
+    
     Args:
+        request: Incoming request (for If-None-Match)
         db: Database session
     
     Returns:
         Latest analysis run with ticket analyses
     """
-    # Get latest analysis run
-    stmt = select(AnalysisRun).order_by(desc(AnalysisRun.created_at)).limit(1)
-    result = db.execute(stmt)
-    analysis_run = result.scalar_one_or_none()
+    # Cheap header lookup of the latest run for the ETag
+    header = (await db.execute(LATEST_RUN_HEADER_STMT)).one_or_none()
     
-    if not analysis_run:
+    if not header:
         raise NotFoundError(
             "No analyses found",
             "Run /api/analyze to create an analysis first"
         )
     
-    # Get ticket analyses for this run
-    stmt = select(TicketAnalysis).where(
-        TicketAnalysis.analysis_run_id == analysis_run.id
-    ).order_by(TicketAnalysis.id)
-    analyses_result = db.execute(stmt)
-    ticket_analyses = list(analyses_result.scalars().all())
+    etag = _analysis_run_etag(header.id, header.created_at, header.status)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": ANALYSIS_RUN_CACHE_CONTROL}
+        )
     
-    return AnalyzeResponse(
-        analysis_run=AnalysisRunResponse.model_validate(analysis_run),
-        ticket_analyses=[TicketAnalysisResponse.model_validate(ta) for ta in ticket_analyses]
+    analyze_response = await _load_analysis_response(db, header.id)
+    if analyze_response is None:
+        raise NotFoundError(f"Analysis run {header.id} not found")
+    
+    return _json_response(
+        analyze_response.model_dump_json(),
+        headers={"ETag": etag, "Cache-Control": ANALYSIS_RUN_CACHE_CONTROL}
     )
 
 
@@ -218,8 +334,8 @@ async def get_latest_analysis(
 async def get_analysis_history(
     limit: int = 10,
     offset: int = 0,
-    db: Session = Depends(get_db)
-) -> AnalysisHistoryResponse:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Get all analysis runs (history).
     
@@ -238,13 +354,13 @@ async def get_analysis_history(
         raise ValidationError("Offset must be >= 0")
     
     try:
-        stmt = select(AnalysisRun).order_by(desc(AnalysisRun.created_at)).limit(limit).offset(offset)
-        result = db.execute(stmt)
-        analysis_runs = list(result.scalars().all())
+        result = await db.execute(RUN_HISTORY_STMT, {"limit": limit, "offset": offset})
+        analysis_runs = result.scalars().all()
         
-        return AnalysisHistoryResponse(
-            analysis_runs=[AnalysisRunResponse.model_validate(ar) for ar in analysis_runs]
+        history = AnalysisHistoryResponse.model_validate(
+            {"analysis_runs": analysis_runs}, from_attributes=True
         )
+        return _json_response(history.model_dump_json())
     
     except Exception as e:
         raise DatabaseError(f"Failed to fetch analysis history: {str(e)}")
@@ -252,8 +368,8 @@ async def get_analysis_history(
 
 @router.get("/tickets", response_model=List[TicketResponse], status_code=status.HTTP_200_OK)
 async def list_tickets(
-    db: Session = Depends(get_db)
-) -> List[TicketResponse]:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     List all tickets.
     
@@ -264,11 +380,14 @@ async def list_tickets(
         List of all tickets
     """
     try:
-        stmt = select(Ticket).order_by(desc(Ticket.created_at))
-        result = db.execute(stmt)
-        tickets = list(result.scalars().all())
+        result = await db.execute(TICKETS_STMT)
+        tickets = result.scalars().all()
         
-        return [TicketResponse.model_validate(ticket) for ticket in tickets]
+        return _json_response(
+            TICKET_LIST_ADAPTER.dump_json(
+                TICKET_LIST_ADAPTER.validate_python(tickets, from_attributes=True)
+            )
+        )
     
     except Exception as e:
         raise DatabaseError(f"Failed to fetch tickets: {str(e)}")
@@ -278,7 +397,7 @@ async def list_tickets(
 async def update_ticket(
     ticket_id: int,
     ticket_update: TicketUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> TicketResponse:
     """
     Update a support ticket.
@@ -293,7 +412,7 @@ async def update_ticket(
     """
     try:
         stmt = select(Ticket).where(Ticket.id == ticket_id)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         ticket = result.scalar_one_or_none()
         
         if not ticket:
@@ -304,21 +423,21 @@ async def update_ticket(
         for field, value in update_data.items():
             setattr(ticket, field, value)
         
-        db.commit()
-        db.refresh(ticket)
+        await db.commit()
+        await db.refresh(ticket)
         
         return TicketResponse.model_validate(ticket)
     
     except NotFoundError:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise DatabaseError(f"Failed to update ticket: {str(e)}")
 
 
 @router.get("/analysis/tickets-summary", status_code=status.HTTP_200_OK)
 async def get_tickets_summary(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> dict:
     """
     Get summary of all tickets analyzed (category and priority distribution).
@@ -329,9 +448,7 @@ async def get_tickets_summary(
     """
     try:
         # Get latest analysis run
-        stmt = select(AnalysisRun).order_by(desc(AnalysisRun.created_at)).limit(1)
-        result = db.execute(stmt)
-        analysis_run = result.scalar_one_or_none()
+        analysis_run = (await db.execute(LATEST_RUN_HEADER_STMT)).one_or_none()
         
         if not analysis_run:
             # No analysis yet, return empty data
@@ -341,122 +458,78 @@ async def get_tickets_summary(
                 "message": "No analysis runs yet. Run analysis to see ticket distribution."
             }
         
-        # Get all ticket analyses for this run
-        stmt = select(TicketAnalysis).where(
-            TicketAnalysis.analysis_run_id == analysis_run.id
-        )
-        analyses_result = db.execute(stmt)
-        ticket_analyses = list(analyses_result.scalars().all())
+        # Calculate category distribution (aggregated in SQL)
+        category_rows = (await db.execute(CATEGORY_COUNTS_STMT, {"run_id": analysis_run.id})).all()
         
-        # Calculate category distribution
-        category_counts: dict = {}
-        for analysis in ticket_analyses:
-            cat = analysis.category.replace('_', ' ')
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        category_data = [
+            {"name": category.replace('_', ' '), "count": count} for category, count in category_rows
+        ]
         
-        category_data = sorted(
-            [{"name": name, "count": count} for name, count in category_counts.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )
+        # Calculate priority distribution (aggregated and ranked high > medium > low in SQL)
+        priority_rows = (await db.execute(PRIORITY_COUNTS_STMT, {"run_id": analysis_run.id})).all()
         
-        # Calculate priority distribution
-        priority_counts: dict = {}
-        for analysis in ticket_analyses:
-            priority_counts[analysis.priority] = priority_counts.get(analysis.priority, 0) + 1
-        
-        priority_order = {"high": 3, "medium": 2, "low": 1}
-        priority_data = sorted(
-            [
-                {
-                    "name": name.capitalize(),
-                    "count": count
-                } for name, count in priority_counts.items()
-            ],
-            key=lambda x: priority_order.get(x["name"].lower(), 0),
-            reverse=True
-        )
+        priority_data = [
+            {"name": priority.capitalize(), "count": count} for priority, count in priority_rows
+        ]
         
         return {
             "category_data": category_data,
             "priority_data": priority_data,
-            "total_analyzed": len(ticket_analyses)
+            "total_analyzed": sum(count for _, count in category_rows)
         }
     
     except Exception as e:
         raise DatabaseError(f"Failed to fetch tickets summary: {str(e)}")
 
 
+# Rows fetched per server-side cursor round trip when streaming /db/view
+DB_VIEW_STREAM_BATCH_SIZE = 500
+
+
+# (response key, query) for each table in the /db/view dump; Core table selects
+# return plain row mappings, skipping ORM instance hydration
+DB_VIEW_TABLES = (
+    ("tickets", select(Ticket.__table__).order_by(desc(Ticket.created_at))),
+    ("analysis_runs", select(AnalysisRun.__table__).order_by(desc(AnalysisRun.created_at))),
+    ("ticket_analyses", select(TicketAnalysis.__table__).order_by(desc(TicketAnalysis.created_at))),
+)
+
+
+async def _stream_database_view() -> AsyncIterator[bytes]:
+    """Yield the /db/view JSON document table by table, one cursor partition at a time."""
+    counts = {}
+    # Own sessions (yield-dependencies are closed before a streamed body is sent), one per
+    # table so the three independent queries start concurrently on the pool
+    async with AsyncExitStack() as stack:
+        sessions = [
+            await stack.enter_async_context(AsyncSessionLocal()) for _ in DB_VIEW_TABLES
+        ]
+        results = await asyncio.gather(*(
+            db.stream(stmt.execution_options(yield_per=DB_VIEW_STREAM_BATCH_SIZE))
+            for db, (_, stmt) in zip(sessions, DB_VIEW_TABLES)
+        ))
+        
+        for (key, _), result in zip(DB_VIEW_TABLES, results):
+            yield (b"{" if not counts else b"],") + orjson.dumps(key) + b":["
+            count = 0
+            async for partition in result.mappings().partitions():
+                # Serialize the partition as a list and strip the brackets
+                chunk = orjson.dumps([dict(row) for row in partition])[1:-1]
+                yield chunk if count == 0 else b"," + chunk
+                count += len(partition)
+            counts[key] = count
+    yield b'],"counts":' + orjson.dumps(counts) + b"}"
+
+
 @router.get("/db/view", status_code=status.HTTP_200_OK)
-async def view_database(
-    db: Session = Depends(get_db)
-) -> dict:
+async def view_database() -> StreamingResponse:
     """
     View all database entries for debugging/admin purposes.
     
+    Rows are streamed from server-side cursors in chunks of DB_VIEW_STREAM_BATCH_SIZE,
+    so memory stays bounded regardless of table size.
+    
     Returns:
-        Dictionary with tickets, analysis_runs, and ticket_analyses
+        Streamed JSON with tickets, analysis_runs, ticket_analyses and counts
     """
-    try:
-        # Get all tickets
-        tickets_stmt = select(Ticket).order_by(desc(Ticket.created_at))
-        tickets_result = db.execute(tickets_stmt)
-        tickets = list(tickets_result.scalars().all())
-        
-        # Get all analysis runs
-        runs_stmt = select(AnalysisRun).order_by(desc(AnalysisRun.created_at))
-        runs_result = db.execute(runs_stmt)
-        analysis_runs = list(runs_result.scalars().all())
-        
-        # Get all ticket analyses
-        analyses_stmt = select(TicketAnalysis).order_by(desc(TicketAnalysis.created_at))
-        analyses_result = db.execute(analyses_stmt)
-        ticket_analyses = list(analyses_result.scalars().all())
-        
-        return {
-            "tickets": [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "description": t.description,
-                    "status": t.status,
-                    "tags": t.tags,
-                    "created_at": t.created_at.isoformat() if t.created_at else None,
-                    "updated_at": t.updated_at.isoformat() if t.updated_at else None,
-                }
-                for t in tickets
-            ],
-            "analysis_runs": [
-                {
-                    "id": ar.id,
-                    "created_at": ar.created_at.isoformat() if ar.created_at else None,
-                    "summary": ar.summary,
-                    "status": ar.status,
-                }
-                for ar in analysis_runs
-            ],
-            "ticket_analyses": [
-                {
-                    "id": ta.id,
-                    "analysis_run_id": ta.analysis_run_id,
-                    "ticket_id": ta.ticket_id,
-                    "category": ta.category,
-                    "priority": ta.priority,
-                    "notes": ta.notes,
-                    "analysis": ta.analysis,
-                    "potential_causes": ta.potential_causes,
-                    "suggested_solutions": ta.suggested_solutions,
-                    "created_at": ta.created_at.isoformat() if ta.created_at else None,
-                }
-                for ta in ticket_analyses
-            ],
-            "counts": {
-                "tickets": len(tickets),
-                "analysis_runs": len(analysis_runs),
-                "ticket_analyses": len(ticket_analyses),
-            }
-        }
-    
-    except Exception as e:
-        raise DatabaseError(f"Failed to fetch database view: {str(e)}")
-
+    return StreamingResponse(_stream_database_view(), media_type="application/json")
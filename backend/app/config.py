@@ -1,6 +1,7 @@
 """Configuration management for the application."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 from pydantic_settings import BaseSettings
@@ -14,6 +15,17 @@ class Settings(BaseSettings):
     
     # LLM API
     openrouter_api_key: Optional[str] = None
+    llm_batch_size: int = 5  # Tickets marshalled into a single LLM request
+    llm_max_concurrency: int = 20  # Max in-flight LLM requests per analysis run
+    llm_rate_limit_rpm: Optional[int] = None  # Overrides the provider profile when set
+    llm_rate_limit_tpm: Optional[int] = None  # Overrides the provider profile when set
+    llm_max_retries: int = 3  # Backoff retries for 429/transient errors
+    llm_cache_size: int = 1024  # Max cached ticket analyses (LRU)
+    llm_max_description_chars: int = 4000  # Longer descriptions are truncated in prompts
+    max_tickets_per_run: Optional[int] = None  # Cap on tickets analyzed when no IDs are given
+    cache_disabled: bool = False  # Set CACHE_DISABLED=true to bypass the LLM, analysis and graph node caches
+    analysis_cache_size: int = 128  # Max cached analysis run responses (LRU)
+    analysis_cache_ttl: int = 3600  # Seconds a cached analysis run response stays valid
     
     # Observability - LangFuse
     langfuse_public_key: Optional[str] = None
@@ -25,9 +37,14 @@ class Settings(BaseSettings):
     debug: bool = False  # Always False in production
     api_port: int = 8000
     
+    # Database pool
+    db_pool_size: int = 50
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_sync_pool_size: int = 5  # Sync engine: agent threads, seeding and migrations only
+    db_sync_max_overflow: int = 5
+    
     # Timeouts (in seconds)
-    db_pool_size: int = 10
-    db_max_overflow: int = 20
     request_timeout: int = 30
     llm_request_timeout: int = 60
     
@@ -38,23 +55,30 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
-
-# Set environment variables for LangFuse (needed before importing langfuse)
-if settings.langfuse_public_key:
-    import os
-    os.environ["LANGFUSE_PUBLIC_KEY"] = settings.langfuse_public_key
-if settings.langfuse_secret_key:
-    import os
-    os.environ["LANGFUSE_SECRET_KEY"] = settings.langfuse_secret_key
-if settings.langfuse_base_url:
-    import os
-    os.environ["LANGFUSE_BASE_URL"] = settings.langfuse_base_url
-
-# Debug logging - don't expose API key details
-if settings.openrouter_api_key:
-    print(f"✅ OPENROUTER_API_KEY loaded successfully")
-else:
-    print(f"⚠️  OPENROUTER_API_KEY not found in environment")
+def _propagate_env(s: Settings) -> None:
+    """Export LangFuse settings as environment variables (needed before importing langfuse)."""
+    if s.langfuse_public_key:
+        os.environ["LANGFUSE_PUBLIC_KEY"] = s.langfuse_public_key
+    if s.langfuse_secret_key:
+        os.environ["LANGFUSE_SECRET_KEY"] = s.langfuse_secret_key
+    if s.langfuse_base_url:
+        os.environ["LANGFUSE_BASE_URL"] = s.langfuse_base_url
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once per process (also usable as a FastAPI dependency)."""
+    s = Settings()
+    _propagate_env(s)
+    
+    # Debug logging - don't expose API key details
+    if s.openrouter_api_key:
+        print(f"✅ OPENROUTER_API_KEY loaded successfully")
+    else:
+        print(f"⚠️  OPENROUTER_API_KEY not found in environment")
+    
+    return s
 
+
+# Global settings instance
+settings = get_settings()
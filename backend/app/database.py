@@ -1,42 +1,82 @@
 """Database connection and session management."""
 
+import os
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
-from typing import Generator
+from typing import AsyncGenerator
 
 from app.config import settings
 
-# Create SQLAlchemy engine with production-ready pooling
+# psycopg2 only: also batch executemany UPDATE/DELETE (INSERTs already use insertmanyvalues)
+dialect_options = {}
+if make_url(settings.database_url).drivername in ("postgresql", "postgresql+psycopg2"):
+    dialect_options["executemany_mode"] = "values_plus_batch"
+
+# Pool sizing: each worker process holds two pools, so budget Postgres max_connections as
+#   pods x workers x ((pool_size + max_overflow) + (db_sync_pool_size + db_sync_max_overflow))
+#   + buffer for admin/migration sessions
+# With the defaults that is 60 + 10 = 70 per worker, inside stock postgres max_connections=100.
+# In production the async pool also scales with CPU count so bursts don't queue on
+# pool_timeout; lower DB_POOL_SIZE or raise max_connections when running several workers.
+pool_size = settings.db_pool_size
+if settings.environment == "production":
+    pool_size = max(pool_size, (os.cpu_count() or 1) * 5)
+
+# Sync engine for the LangGraph agent, seeding and migrations (small dedicated pool)
 engine = create_engine(
     settings.database_url,
     poolclass=QueuePool,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
+    pool_size=settings.db_sync_pool_size,
+    max_overflow=settings.db_sync_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    query_cache_size=2000,  # Compiled-statement cache (default 500)
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=3600,  # Recycle connections after 1 hour
     echo=settings.debug,  # Log SQL queries in debug mode
-    connect_args={"connect_timeout": 10}  # Connection timeout
+    connect_args={"connect_timeout": 10},  # Connection timeout
+    **dialect_options
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) for API routes, so DB I/O doesn't block the event loop
+async_engine = create_async_engine(
+    make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    pool_size=pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    query_cache_size=2000,  # Compiled-statement cache (default 500)
+    pool_pre_ping=True,  # Verify connections before using
+    pool_recycle=3600,  # Recycle connections after 1 hour
+    echo=settings.debug,  # Log SQL queries in debug mode
+    connect_args={"timeout": 10},  # Connection timeout
+)
+
+# Async session factory
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
 # Base class for models
 Base = declarative_base()
 
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency function to get database session.
+    Dependency function to get an async database session.
     
     Yields:
-        Database session
+        Async database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
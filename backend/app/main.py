@@ -1,8 +1,11 @@
 """FastAPI application entry point."""
 
+import asyncio
+
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from pathlib import Path
 from fastapi.staticfiles import StaticFiles
@@ -16,23 +19,39 @@ from app.api.exceptions import (
     validation_exception_handler
 )
 from fastapi.exceptions import RequestValidationError
-from app.agent.seed_data import seed_database
+from app.agent.seed_data import seed_database, seed_done
 from app.database import SessionLocal
+from app.agent.cache import analysis_cache
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Support Ticket Analyst API",
     description="AI-powered support ticket analysis with LangGraph",
     version="1.0.0",
+    default_response_class=ORJSONResponse,  # orjson serializes much faster than stdlib json
 )
 
 # Serve static files from React/Vite build
 # Path resolution: __file__ is backend/app/main.py
 # So: __file__.parent = backend/app, .parent = backend, .parent = project root
-frontend_build_path = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
-frontend_build_path_legacy = Path(__file__).resolve().parent.parent.parent / "frontend" / "build"
+project_root = Path(__file__).resolve().parent.parent.parent
+frontend_build_path = project_root / "frontend" / "dist"
+frontend_build_path_legacy = project_root / "frontend" / "build"
 frontend_build_path_docker = Path("/app/frontend/dist")  # Docker volume mount location
 
+# Frontend index.html resolved once at import (Vite dist, legacy build, then Docker mount)
+FRONTEND_INDEX = next(
+    (
+        index for index in (
+            frontend_build_path / "index.html",
+            frontend_build_path_legacy / "index.html",
+            frontend_build_path_docker / "index.html",
+        )
+        if index.exists()
+    ),
+    None
+)
+
 # Try Vite dist first, then legacy build
 if frontend_build_path.exists() and (frontend_build_path / "assets").exists():
     app.mount("/assets", StaticFiles(directory=str(frontend_build_path / "assets")), name="assets")
@@ -41,6 +60,9 @@ elif frontend_build_path_legacy.exists() and (frontend_build_path_legacy / "stat
 elif frontend_build_path_docker.exists() and (frontend_build_path_docker / "assets").exists():
     app.mount("/assets", StaticFiles(directory=str(frontend_build_path_docker / "assets")), name="assets")
 
+# Gzip large JSON payloads (/db/view, analysis runs); small health/error bodies skip it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -58,6 +80,24 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.include_router(router)
 
 
+def _seed_in_session() -> None:
+    """Run seed_database with its own session (called off the event loop)."""
+    db = SessionLocal()
+    try:
+        # Clears analysis tables and seeds tickets if empty
+        seed_database(db)
+    finally:
+        db.close()
+
+
+async def _run_seed() -> None:
+    """Seed in a worker thread, then release requests waiting on seed_done."""
+    try:
+        await asyncio.to_thread(_seed_in_session)
+    finally:
+        seed_done.set()
+
+
 # Startup event to seed database
 @app.on_event("startup")
 async def startup_event():
@@ -65,21 +105,22 @@ async def startup_event():
     # Seed by default, can be disabled by setting SEED_DATABASE=false
     import os
     if os.getenv("SEED_DATABASE", "true").lower() != "false":
-        db = SessionLocal()
-        try:
-            # Clears analysis tables and seeds tickets if empty
-            seed_database(db)
-        finally:
-            db.close()
+        # Seed in the background so the server (and /api/health) comes up immediately
+        app.state.seed_task = asyncio.create_task(_run_seed())
     else:
         print("ℹ️  Database seeding is disabled. Set SEED_DATABASE=true (or omit) to enable.")
+        seed_done.set()
 
 
 # Health check endpoint for Docker
 @app.get("/api/health", tags=["health"])
 async def health_check():
     """Health check endpoint for Docker healthchecks and monitoring."""
-    return {"status": "healthy", "message": "Support Ticket Analyst API is running"}
+    return {
+        "status": "healthy",
+        "message": "Support Ticket Analyst API is running",
+        "analysis_cache": analysis_cache.stats()
+    }
 
 
 @app.get("/{full_path:path}")
@@ -89,17 +130,8 @@ async def serve_frontend(full_path: str):
     if full_path.startswith("api"):
         raise HTTPException(status_code=404, detail="Not found")
     
-    # Try Vite dist first, then legacy build
-    frontend_index = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist" / "index.html"
-    frontend_index_legacy = Path(__file__).resolve().parent.parent.parent / "frontend" / "build" / "index.html"
-    frontend_index_docker = Path("/app/frontend/dist/index.html")
-    
-    if frontend_index.exists():
-        return FileResponse(str(frontend_index), media_type="text/html")
-    elif frontend_index_legacy.exists():
-        return FileResponse(str(frontend_index_legacy), media_type="text/html")
-    elif frontend_index_docker.exists():
-        return FileResponse(str(frontend_index_docker), media_type="text/html")
+    if FRONTEND_INDEX is not None:
+        return FileResponse(str(FRONTEND_INDEX), media_type="text/html")
     
     return {"message": "Support Ticket Analyst API", "version": "1.0.0", "note": "Frontend not built. Run 'npm run build' in frontend directory."}
 
@@ -1,6 +1,7 @@
 """SQLAlchemy ORM models for database tables."""
 
-from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -11,8 +12,11 @@ class Ticket(Base):
     """Support ticket model."""
     
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("idx_tickets_created_at", "created_at"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
     status = Column(String(50), default="open", nullable=False)  # open, in_progress, resolved, closed
@@ -28,30 +32,45 @@ class AnalysisRun(Base):
     """Analysis run model - groups ticket analyses together."""
     
     __tablename__ = "analysis_runs"
+    __table_args__ = (
+        # Latest-run / history lookups order by created_at DESC
+        Index("idx_analysis_runs_created_at", "created_at"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     summary = Column(Text, nullable=False)
     status = Column(String(50), default="completed")
     
     # Relationship to ticket analyses
-    ticket_analyses = relationship("TicketAnalysis", back_populates="analysis_run")
+    ticket_analyses = relationship(
+        "TicketAnalysis",
+        back_populates="analysis_run",
+        order_by="TicketAnalysis.id"
+    )
 
 
 class TicketAnalysis(Base):
     """Ticket analysis model - links tickets to analysis runs with results."""
     
     __tablename__ = "ticket_analysis"
+    __table_args__ = (
+        # Per-run analyses ordered by id: index range scan, no sort step
+        Index("idx_ticket_analysis_run_id_id", "analysis_run_id", "id"),
+        # Covering indexes for per-run category/priority GROUP BY aggregates
+        Index("idx_ticket_analysis_run_category", "analysis_run_id", "category"),
+        Index("idx_ticket_analysis_run_priority", "analysis_run_id", "priority"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     analysis_run_id = Column(Integer, ForeignKey("analysis_runs.id"), nullable=False)
     ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False)
     category = Column(String(100), nullable=False)
     priority = Column(String(50), nullable=False)
     notes = Column(Text, nullable=True)  # Legacy field, keeping for backward compatibility
     analysis = Column(Text, nullable=True)  # Brief explanation of the issue
-    potential_causes = Column(Text, nullable=True)  # JSON array stored as text
-    suggested_solutions = Column(Text, nullable=True)  # JSON array stored as text
+    potential_causes = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # JSON array of strings
+    suggested_solutions = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # JSON array of strings
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
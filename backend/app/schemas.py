@@ -1,8 +1,14 @@
 """Pydantic schemas for request/response validation and LLM outputs."""
 
 from datetime import datetime, timezone
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from functools import partial
+from typing import Annotated, List, Optional, Literal, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+from pydantic.dataclasses import dataclass
+
+
+# Aware "now" bound once; a C-level partial avoids a lambda frame per call
+utc_now = partial(datetime.now, timezone.utc)
 
 
 # ===== Request Schemas =====
@@ -15,6 +21,15 @@ class TicketCreate(BaseModel):
     tags: Optional[str] = Field(default=None, description="Comma-separated tags")
 
 
+# Bulk ingest: one pydantic-core call validates every row and collects all row errors
+BULK_TICKET_ADAPTER = TypeAdapter(List[TicketCreate])
+
+
+def validate_bulk(rows: List[dict]) -> List[TicketCreate]:
+    """Validate a batch of raw ticket rows in a single pass."""
+    return BULK_TICKET_ADAPTER.validate_python(rows)
+
+
 class TicketUpdate(BaseModel):
     """Schema for updating a ticket."""
     title: Optional[str] = Field(None, min_length=1, max_length=255, description="Ticket title")
@@ -43,8 +58,7 @@ class TicketResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True  # Enable ORM mode
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True, extra="ignore", defer_build=False)  # Enable ORM mode
 
 
 class TicketAnalysisResponse(BaseModel):
@@ -56,12 +70,11 @@ class TicketAnalysisResponse(BaseModel):
     priority: str
     notes: Optional[str] = None
     analysis: Optional[str] = None
-    potential_causes: Optional[str] = None  # JSON array as string
-    suggested_solutions: Optional[str] = None  # JSON array as string
+    potential_causes: Optional[List[str]] = None
+    suggested_solutions: Optional[List[str]] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True, extra="ignore", defer_build=False)
 
 
 class AnalysisRunResponse(BaseModel):
@@ -71,23 +84,38 @@ class AnalysisRunResponse(BaseModel):
     summary: str
     status: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True, extra="ignore", defer_build=False)
+
 
+# Response containers hold tuples: immutable like the frozen items (cached responses are
+# shared across requests) and serialized on pydantic-core's tighter tuple path
 
 class AnalyzeResponse(BaseModel):
     """Schema for analyze endpoint response."""
     analysis_run: AnalysisRunResponse
-    ticket_analyses: List[TicketAnalysisResponse]
+    ticket_analyses: Tuple[TicketAnalysisResponse, ...]
 
 
 class AnalysisHistoryResponse(BaseModel):
     """Schema for analysis history response."""
-    analysis_runs: List[AnalysisRunResponse]
+    analysis_runs: Tuple[AnalysisRunResponse, ...]
+
+
+# List adapter built once at import: validates a whole ORM result list and dumps it
+# to JSON bytes in a single pydantic-core pass
+TICKET_LIST_ADAPTER = TypeAdapter(List[TicketResponse])
 
 
 # ===== LLM Output Schemas =====
 
+# Allowed labels, shared by the output model and the LLM response schema
+TicketCategory = Literal["bug", "billing", "feature_request", "other"]
+TicketPriority = Literal["low", "medium", "high"]
+
+# List entries for causes/solutions; bounds are enforced natively by pydantic-core
+AnalysisListItem = Annotated[str, StringConstraints(min_length=10, max_length=150)]
+
+
 class TicketAnalysisOutput(BaseModel):
     """Schema for LLM-structured output when analyzing a ticket.
     
@@ -98,11 +126,13 @@ class TicketAnalysisOutput(BaseModel):
     - potential_causes -> Detailed Analysis card (bulleted list)
     - suggested_solutions -> Detailed Analysis card (numbered list)
     """
-    category: Literal["bug", "billing", "feature_request", "other"] = Field(
+    model_config = ConfigDict(defer_build=False)
+    
+    category: TicketCategory = Field(
         ...,
         description="Category of the ticket: bug, billing, feature_request, or other"
     )
-    priority: Literal["low", "medium", "high"] = Field(
+    priority: TicketPriority = Field(
         ...,
         description="Priority level: low, medium, or high"
     )
@@ -112,44 +142,66 @@ class TicketAnalysisOutput(BaseModel):
         max_length=500,
         description="Brief explanation of the issue (1-2 sentences, 10-500 characters)"
     )
-    potential_causes: List[str] = Field(
+    potential_causes: List[AnalysisListItem] = Field(
         ...,
         min_length=2,
         max_length=3,
         description="List of 2-3 likely root causes (each 10-150 characters)"
     )
-    suggested_solutions: List[str] = Field(
+    suggested_solutions: List[AnalysisListItem] = Field(
         ...,
         min_length=2,
         max_length=3,
         description="List of 2-3 actionable next steps (each 10-150 characters)"
     )
-    
-    @field_validator('potential_causes', 'suggested_solutions')
-    @classmethod
-    def validate_list_items(cls, v: List[str]) -> List[str]:
-        """Validate each item in the list has proper length."""
-        for item in v:
-            if len(item) < 10:
-                raise ValueError(f"Each item must be at least 10 characters, got: {item[:50]}")
-            if len(item) > 150:
-                raise ValueError(f"Each item must be at most 150 characters, got: {len(item)} chars")
-        return v
-    
+
+
+class TicketAnalysisBatchItem(TicketAnalysisOutput):
+    """Schema for a single ticket analysis inside a batched LLM response."""
+    ticket_id: int = Field(..., description="ID of the analyzed ticket")
+
+
+class TicketAnalysisBatchOutput(BaseModel):
+    """Schema for LLM-structured output when analyzing several tickets in one request."""
+    analyses: List[TicketAnalysisBatchItem] = Field(
+        ...,
+        description="One analysis per ticket in the request"
+    )
+
+
+# Validators compiled once at import; LLM output is validated straight from raw JSON
+# in pydantic-core, with no intermediate json.loads/dict round-trip
+TICKET_ANALYSIS_ADAPTER = TypeAdapter(TicketAnalysisOutput)
+TICKET_ANALYSIS_BATCH_ADAPTER = TypeAdapter(TicketAnalysisBatchOutput)
+
+
+def parse_llm_output(raw: Union[str, bytes]) -> TicketAnalysisOutput:
+    """Validate one ticket analysis from raw LLM JSON output."""
+    return TICKET_ANALYSIS_ADAPTER.validate_json(raw)
+
+
+def parse_llm_batch_output(raw: Union[str, bytes]) -> TicketAnalysisBatchOutput:
+    """Validate a batched analysis response from raw LLM JSON output."""
+    return TICKET_ANALYSIS_BATCH_ADAPTER.validate_json(raw)
 
 
 # ===== Error Schemas =====
+# Built on every 4xx/5xx, so these are slotted frozen dataclasses rather than models
 
-class ErrorDetail(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ErrorDetail:
     """Schema for error details."""
     code: str = Field(..., description="Error code")
     message: str = Field(..., description="Error message")
     details: Optional[str] = Field(None, description="Additional error details")
 
 
-class ErrorResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ErrorResponse:
     """Schema for error responses."""
     error: ErrorDetail
     trace_id: Optional[str] = Field(None, description="Request trace ID for debugging")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=utc_now)
+
 
+ERROR_RESPONSE_ADAPTER = TypeAdapter(ErrorResponse)
@@ -26,8 +26,8 @@ CREATE TABLE IF NOT EXISTS ticket_analysis (
     priority VARCHAR(50) NOT NULL,
     notes TEXT,
     analysis TEXT,
-    potential_causes TEXT,
-    suggested_solutions TEXT,
+    potential_causes JSONB,
+    suggested_solutions JSONB,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     -- Ensure one analysis per ticket per run
     UNIQUE(analysis_run_id, ticket_id)
@@ -38,4 +38,6 @@ CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets(created_at);
 CREATE INDEX IF NOT EXISTS idx_analysis_runs_created_at ON analysis_runs(created_at);
 CREATE INDEX IF NOT EXISTS idx_ticket_analysis_run_id ON ticket_analysis(analysis_run_id);
 CREATE INDEX IF NOT EXISTS idx_ticket_analysis_ticket_id ON ticket_analysis(ticket_id);
-
+CREATE INDEX IF NOT EXISTS idx_ticket_analysis_run_id_id ON ticket_analysis(analysis_run_id, id);
+CREATE INDEX IF NOT EXISTS idx_ticket_analysis_run_category ON ticket_analysis(analysis_run_id, category);
+CREATE INDEX IF NOT EXISTS idx_ticket_analysis_run_priority ON ticket_analysis(analysis_run_id, priority);
@@ -235,21 +235,9 @@ const AnalysisResults: React.FC<AnalysisResultsProps> = ({
                     <div>
                       <h4 className="font-semibold text-gray-900 text-sm mb-2">Potential Causes</h4>
                       <ul className="text-sm text-gray-700 list-disc list-inside space-y-1">
-                        {(() => {
-                          try {
-                            const causes = typeof analysis.potential_causes === 'string' 
-                              ? JSON.parse(analysis.potential_causes)
-                              : analysis.potential_causes;
-                            if (Array.isArray(causes)) {
-                              return causes.map((cause: string, idx: number) => (
-                                <li key={idx}>{cause}</li>
-                              ));
-                            }
-                            return <li>{String(causes)}</li>;
-                          } catch (e) {
-                            return <li>{String(analysis.potential_causes)}</li>;
-                          }
-                        })()}
+                        {analysis.potential_causes.map((cause, idx) => (
+                          <li key={idx}>{cause}</li>
+                        ))}
                       </ul>
                     </div>
                   )}
@@ -259,21 +247,9 @@ const AnalysisResults: React.FC<AnalysisResultsProps> = ({
                     <div>
                       <h4 className="font-semibold text-gray-900 text-sm mb-2">Suggested Solutions</h4>
                       <ol className="text-sm text-gray-700 list-decimal list-inside space-y-1">
-                        {(() => {
-                          try {
-                            const solutions = typeof analysis.suggested_solutions === 'string' 
-                              ? JSON.parse(analysis.suggested_solutions)
-                              : analysis.suggested_solutions;
-                            if (Array.isArray(solutions)) {
-                              return solutions.map((solution: string, idx: number) => (
-                                <li key={idx}>{solution}</li>
-                              ));
-                            }
-                            return <li>{String(solutions)}</li>;
-                          } catch (e) {
-                            return <li>{String(analysis.suggested_solutions)}</li>;
-                          }
-                        })()}
+                        {analysis.suggested_solutions.map((solution, idx) => (
+                          <li key={idx}>{solution}</li>
+                        ))}
                       </ol>
                     </div>
                   )}
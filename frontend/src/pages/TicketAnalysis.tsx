@@ -11,6 +11,30 @@ interface SessionAnalysis {
   sessionRunNumber: number;
 }
 
+// Entries saved before causes/solutions became JSON arrays hold them as JSON-encoded strings
+const toStringList = (value: unknown): string[] | null => {
+  if (Array.isArray(value)) return value;
+  if (typeof value === 'string') {
+    try {
+      const parsed = JSON.parse(value);
+      return Array.isArray(parsed) ? parsed : [value];
+    } catch (e) {
+      return [value];
+    }
+  }
+  return null;
+};
+
+const parseStoredAnalyses = (stored: string): SessionAnalysis[] =>
+  (JSON.parse(stored) as SessionAnalysis[]).map((session) => ({
+    ...session,
+    ticket_analyses: session.ticket_analyses.map((analysis) => ({
+      ...analysis,
+      potential_causes: toStringList(analysis.potential_causes),
+      suggested_solutions: toStringList(analysis.suggested_solutions),
+    })),
+  }));
+
 const TicketAnalysisPage = () => {
   const [activeTab, setActiveTab] = useState('tickets');
   const [latestAnalysis, setLatestAnalysis] = useState<SessionAnalysis | null>(null);
@@ -42,7 +66,7 @@ const TicketAnalysisPage = () => {
     const storedCounter = localStorage.getItem('sessionRunCounter');
     if (stored) {
       try {
-        const parsed = JSON.parse(stored);
+        const parsed = parseStoredAnalyses(stored);
         setSessionAnalyses(parsed);
         if (parsed.length > 0) {
           setLatestAnalysis(parsed[parsed.length - 1]);
@@ -71,7 +95,7 @@ const TicketAnalysisPage = () => {
       const stored = localStorage.getItem('sessionAnalyses');
       if (stored) {
         try {
-          const parsed: SessionAnalysis[] = JSON.parse(stored);
+          const parsed = parseStoredAnalyses(stored);
           if (parsed.length > 0) {
             setLatestAnalysis(parsed[parsed.length - 1]);
             // Also update sessionAnalyses state to keep them in sync
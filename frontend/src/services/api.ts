@@ -32,8 +32,8 @@ export interface TicketAnalysis {
   priority: string;
   notes?: string | null;
   analysis?: string | null;
-  potential_causes?: string | null;
-  suggested_solutions?: string | null;
+  potential_causes?: string[] | null;
+  suggested_solutions?: string[] | null;
   created_at: string;
 }
 